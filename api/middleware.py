@@ -0,0 +1,130 @@
+"""
+ASGI middleware for the SmarTest API.
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+
+
+class ResponseCacheMiddleware:
+    """
+    In-process cache for successful GET responses under a path prefix.
+
+    Entries are keyed on path + query string and expire after `ttl` seconds.
+    The cache holds at most `maxsize` entries and `maxbytes` of bodies (least
+    recently used entries are evicted first); larger bodies are not cached.
+    Requests matching `writes` (method, path prefix) change cached reads and
+    clear the cache before and after they run, so a cached read never
+    outlives a write handled by this process. Other non-GET requests (such as
+    evaluations) leave the cache alone. Paths in `passthrough` are neither
+    cached nor treated as writes.
+    """
+
+    def __init__(
+        self,
+        app,
+        prefix: str = "/api",
+        maxsize: int = 1024,
+        maxbytes: int = 64 * 1024 * 1024,
+        ttl: float = 30.0,
+        passthrough: Tuple[str, ...] = (),
+        writes: Tuple[Tuple[str, str], ...] = ()
+    ):
+        self.app = app
+        self.prefix = prefix
+        self.passthrough = passthrough
+        self.writes = writes
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.ttl = ttl
+        # key -> (expires_at, status, headers, body)
+        self._entries: "OrderedDict[str, Tuple[float, int, List[Tuple[bytes, bytes]], bytes]]" = OrderedDict()
+        self._bytes = 0  # Total body size of cached entries
+        self._version = 0
+
+    def clear(self):
+        """Drop all cached responses and invalidate in-flight reads."""
+        self._version += 1
+        self._entries.clear()
+        self._bytes = 0
+
+    def _discard(self, key: str):
+        """Remove one entry, keeping the byte total in step."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[3])
+
+    def _is_write(self, method: str, path: str) -> bool:
+        """Whether a request can change the responses this cache holds."""
+        return any(
+            method == write_method and path.startswith(write_prefix)
+            for write_method, write_prefix in self.writes
+        )
+
+    async def __call__(self, scope: Dict[str, Any], receive, send):
+        if (
+            scope["type"] != "http"
+            or not scope["path"].startswith(self.prefix)
+            or scope["path"] in self.passthrough
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] != "GET":
+            if not self._is_write(scope["method"], scope["path"]):
+                await self.app(scope, receive, send)
+                return
+
+            self.clear()
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                self.clear()
+            return
+
+        key = f"{scope['path']}?{scope['query_string'].decode('latin-1')}"
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            expires_at, status, headers, body = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                await send({"type": "http.response.start", "status": status, "headers": headers})
+                await send({"type": "http.response.body", "body": body})
+                return
+            self._discard(key)
+
+        # Miss: run the handler and capture what it sends
+        version = self._version
+        start_message = None
+        chunks = []
+
+        async def capture(message):
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                start_message = message
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        await self.app(scope, receive, capture)
+
+        # Only store complete 200 responses not raced by a write
+        if start_message is None or start_message["status"] != 200 or version != self._version:
+            return
+
+        body = b"".join(chunks)
+        if len(body) > self.maxbytes:
+            return
+
+        self._discard(key)
+        self._entries[key] = (
+            time.monotonic() + self.ttl,
+            start_message["status"],
+            list(start_message.get("headers", [])),
+            body
+        )
+        self._bytes += len(body)
+
+        while len(self._entries) > self.maxsize or self._bytes > self.maxbytes:
+            self._discard(next(iter(self._entries)))
@@ -1,7 +1,10 @@
 """
 API endpoints for the SmarTest application.
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ValidationError
 from sqlalchemy.orm import Session
 from database.connection import get_db
 from services.question_service import QuestionService
@@ -10,33 +13,101 @@ from services.test_service import TestService
 from api.schemas import (
     GenerateQuestionsRequest,
     EvaluateAnswerRequest,
+    EvaluateAnswersRequest,
     CreateTestRequest,
     QuestionResponse,
     QuestionListResponse,
     AnswerResponse,
     EvaluationResponse,
+    EvaluationListResponse,
     TestResponse,
     TestWithQuestionsResponse,
     TestListResponse,
     TestSummaryResponse,
     ErrorResponse,
-    SuccessResponse
+    SuccessResponse,
+    BatchRequest,
+    BatchSubRequest,
+    BatchResponse,
+    QuestionType,
+    Difficulty,
+    DetailLevel
 )
-from typing import Optional
+from typing import Optional, List, Dict, Any, Type
+import asyncio
+import orjson
 
 router = APIRouter(prefix="/api", tags=["SmarTest API"])
 
 
+def _question_list_response(blobs: List[bytes]) -> Response:
+    """Splice pre-serialized question JSON into a QuestionListResponse body."""
+    content = b'{"questions":[' + b",".join(blobs) + b'],"total":' + str(len(blobs)).encode() + b"}"
+    return Response(content=content, media_type="application/json")
+
+
+def _json_body(model: Type[BaseModel]):
+    """
+    Build a dependency that parses the raw request body straight into `model`.
+
+    model_validate_json decodes and validates in a single pass over the bytes,
+    skipping the intermediate dict FastAPI builds for regular body parameters.
+    Errors are reported in the same shape as FastAPI's own body validation.
+    """
+    async def parse(request: Request):
+        try:
+            return model.model_validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError([
+                {**error, "loc": ("body", *error["loc"])}
+                for error in e.errors(include_url=False)
+            ])
+
+    return parse
+
+
+# Component schemas of _json_body models (FastAPI only collects regular body params)
+JSON_BODY_SCHEMAS: Dict[str, Any] = {}
+
+
+def _json_body_docs(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    OpenAPI requestBody for endpoints that parse their body with _json_body.
+
+    The model and any nested models are registered in JSON_BODY_SCHEMAS and
+    referenced from components.schemas (see add_json_body_schemas).
+    """
+    schema = model.model_json_schema(ref_template="#/components/schemas/{model}")
+    JSON_BODY_SCHEMAS.update(schema.pop("$defs", {}))
+    JSON_BODY_SCHEMAS[model.__name__] = schema
+
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": {"$ref": f"#/components/schemas/{model.__name__}"}}}
+        }
+    }
+
+
+def add_json_body_schemas(openapi_schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Add the _json_body model schemas to a generated OpenAPI document."""
+    schemas = openapi_schema.setdefault("components", {}).setdefault("schemas", {})
+    for name, schema in JSON_BODY_SCHEMAS.items():
+        schemas.setdefault(name, schema)
+    return openapi_schema
+
+
 # Question Endpoints
 
 @router.post(
     "/generate-questions",
     response_model=QuestionListResponse,
     summary="Generate Questions",
-    description="Generate one or more questions of a specified type and difficulty"
+    description="Generate one or more questions of a specified type and difficulty",
+    openapi_extra=_json_body_docs(GenerateQuestionsRequest)
 )
 def generate_questions(
-    request: GenerateQuestionsRequest,
+    request: GenerateQuestionsRequest = Depends(_json_body(GenerateQuestionsRequest)),
     db: Session = Depends(get_db)
 ):
     """
@@ -60,22 +131,8 @@ def generate_questions(
             **params
         )
 
-        # Convert to response format (parse JSON strings to dicts)
-        questions_response = []
-        for q in questions:
-            questions_response.append({
-                "id": q.id,
-                "type": q.type,
-                "difficulty": q.difficulty,
-                "question_text": q.question_text,
-                "question_data": q.get_question_data(),  # Parse JSON string to dict
-                "created_at": q.created_at
-            })
-
-        return {
-            "questions": questions_response,
-            "total": len(questions_response)
-        }
+        # Blobs were serialized at generation time and are still in memory
+        return _question_list_response([q.response_blob for q in questions])
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -90,37 +147,22 @@ def generate_questions(
     description="Get all questions with optional filters"
 )
 def get_questions(
-    type: Optional[str] = Query(None, description="Filter by question type"),
-    difficulty: Optional[str] = Query(None, description="Filter by difficulty"),
+    type: Optional[QuestionType] = Query(None, description="Filter by question type"),
+    difficulty: Optional[Difficulty] = Query(None, description="Filter by difficulty"),
     limit: int = Query(100, ge=1, le=500, description="Maximum number of questions"),
     db: Session = Depends(get_db)
 ):
     """
     Retrieve all questions with optional filtering.
     """
-    questions = QuestionService.get_all_questions(
+    blobs = QuestionService.get_question_blobs(
         db,
         question_type=type,
         difficulty=difficulty,
         limit=limit
     )
 
-    # Convert to response format
-    questions_response = []
-    for q in questions:
-        questions_response.append({
-            "id": q.id,
-            "type": q.type,
-            "difficulty": q.difficulty,
-            "question_text": q.question_text,
-            "question_data": q.get_question_data(),
-            "created_at": q.created_at
-        })
-
-    return {
-        "questions": questions_response,
-        "total": len(questions_response)
-    }
+    return _question_list_response(blobs)
 
 
 @router.get(
@@ -136,19 +178,12 @@ def get_question(
     """
     Retrieve a specific question by its ID.
     """
-    question = QuestionService.get_question(db, question_id)
+    content = QuestionService.get_question_blob(db, question_id)
 
-    if not question:
+    if content is None:
         raise HTTPException(status_code=404, detail=f"Question {question_id} not found")
 
-    return {
-        "id": question.id,
-        "type": question.type,
-        "difficulty": question.difficulty,
-        "question_text": question.question_text,
-        "question_data": question.get_question_data(),
-        "created_at": question.created_at
-    }
+    return Response(content=content, media_type="application/json")
 
 
 @router.get(
@@ -159,7 +194,7 @@ def get_question(
 )
 def get_answer(
     question_id: str,
-    detail_level: str = Query("detailed", regex="^(concise|detailed)$"),
+    detail_level: DetailLevel = Query("detailed"),
     db: Session = Depends(get_db)
 ):
     """
@@ -172,7 +207,7 @@ def get_answer(
     if not answer_data:
         raise HTTPException(status_code=404, detail=f"Question {question_id} not found")
 
-    return answer_data
+    return ORJSONResponse(answer_data)
 
 
 @router.delete(
@@ -205,10 +240,11 @@ def delete_question(
     "/evaluate-answer",
     response_model=EvaluationResponse,
     summary="Evaluate Answer",
-    description="Evaluate a student's answer and provide score with feedback"
+    description="Evaluate a student's answer and provide score with feedback",
+    openapi_extra=_json_body_docs(EvaluateAnswerRequest)
 )
 def evaluate_answer(
-    request: EvaluateAnswerRequest,
+    request: EvaluateAnswerRequest = Depends(_json_body(EvaluateAnswerRequest)),
     db: Session = Depends(get_db)
 ):
     """
@@ -217,40 +253,84 @@ def evaluate_answer(
     Returns score (0-100), detailed feedback, correct answer, and explanation.
     """
     try:
-        evaluation = EvaluationService.evaluate_answer(
+        result = EvaluationService.evaluate_answer(
             db,
             question_id=request.question_id,
             student_answer=request.student_answer
         )
 
-        if not evaluation:
+        if not result:
             raise HTTPException(
                 status_code=404,
                 detail=f"Question {request.question_id} not found"
             )
 
-        # Build response with additional data
-        response = {
+        evaluation = result.evaluation
+
+        return {
             "id": evaluation.id,
             "question_id": evaluation.question_id,
             "student_answer": evaluation.student_answer,
             "score": evaluation.score,
             "feedback": evaluation.get_feedback(),
+            "correct_answer": result.correct_answer,
+            "explanation": result.explanation,
             "evaluated_at": evaluation.evaluated_at
         }
 
-        # Add correct answer and explanation if available
-        if hasattr(evaluation, '_correct_answer'):
-            response["correct_answer"] = evaluation._correct_answer
-        if hasattr(evaluation, '_explanation'):
-            response["explanation"] = evaluation._explanation
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error evaluating answer: {str(e)}")
+
 
-        return response
+@router.post(
+    "/evaluate-answers",
+    response_model=EvaluationListResponse,
+    summary="Evaluate Answers",
+    description="Evaluate several student answers in one request",
+    openapi_extra=_json_body_docs(EvaluateAnswersRequest)
+)
+def evaluate_answers(
+    request: EvaluateAnswersRequest = Depends(_json_body(EvaluateAnswersRequest)),
+    db: Session = Depends(get_db)
+):
+    """
+    Evaluate a batch of answers (e.g. a whole class) with one commit.
 
+    All answers are rejected if any referenced question does not exist.
+    """
+    try:
+        results = EvaluationService.evaluate_answers_bulk(
+            db,
+            [(answer.question_id, answer.student_answer) for answer in request.answers]
+        )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error evaluating answer: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error evaluating answers: {str(e)}")
+
+    if results is None:
+        raise HTTPException(status_code=404, detail="One or more questions not found")
+
+    evaluations_response = [
+        {
+            "id": result.evaluation.id,
+            "question_id": result.evaluation.question_id,
+            "student_answer": result.evaluation.student_answer,
+            "score": result.evaluation.score,
+            "feedback": result.evaluation.get_feedback(),
+            "correct_answer": result.correct_answer,
+            "explanation": result.explanation,
+            "evaluated_at": result.evaluation.evaluated_at
+        }
+        for result in results
+    ]
+
+    return {
+        "evaluations": evaluations_response,
+        "total": len(evaluations_response)
+    }
 
 
 @router.get(
@@ -330,12 +410,13 @@ def get_tests(
     """
     Retrieve all tests.
     """
-    tests = TestService.get_all_tests(db, limit=limit)
+    tests = TestService.get_all_test_rows(db, limit=limit)
 
-    return {
+    # Trusted DB data: returning a Response skips response_model re-validation
+    return ORJSONResponse(content={
         "tests": tests,
         "total": len(tests)
-    }
+    })
 
 
 @router.get(
@@ -351,32 +432,20 @@ def get_test(
     """
     Retrieve a specific test with all its questions.
     """
-    test = TestService.get_test(db, test_id)
+    test = TestService.get_test_row(db, test_id)
 
     if not test:
         raise HTTPException(status_code=404, detail=f"Test {test_id} not found")
 
-    questions = TestService.get_test_questions(db, test_id)
+    blobs = TestService.get_test_question_blobs(db, test_id)
 
-    # Convert questions to response format
-    questions_response = []
-    for q in questions:
-        questions_response.append({
-            "id": q.id,
-            "type": q.type,
-            "difficulty": q.difficulty,
-            "question_text": q.question_text,
-            "question_data": q.get_question_data(),
-            "created_at": q.created_at
-        })
-
-    return {
-        "id": test.id,
-        "title": test.title,
-        "created_at": test.created_at,
-        "questions": questions_response,
-        "total_questions": len(questions_response)
-    }
+    # Splice the stored question JSON into the test object
+    content = (
+        orjson.dumps(test)[:-1]
+        + b',"questions":[' + b",".join(blobs)
+        + b'],"total_questions":' + str(len(blobs)).encode() + b"}"
+    )
+    return Response(content=content, media_type="application/json")
 
 
 @router.get(
@@ -421,4 +490,99 @@ def delete_test(
     return {
         "success": True,
         "message": f"Test {test_id} deleted successfully"
-    }
\ No newline at end of file
+    }
+
+
+# Batch Endpoint
+
+BATCH_PATH = "/api/batch"
+
+
+async def _dispatch_subrequest(app, sub: BatchSubRequest) -> Dict[str, Any]:
+    """
+    Run one batch entry through the application in-process.
+
+    The call goes through the full ASGI stack, so routing, validation,
+    error handling and middleware behave exactly as for a direct request.
+    """
+    method = sub.method.upper()
+    path, _, query = sub.url.partition("?")
+
+    if method not in ("GET", "POST", "DELETE"):
+        return {"id": sub.id, "status": 405, "body": {"detail": f"Method {sub.method} not allowed in batch"}}
+    if not path.startswith(router.prefix + "/") or path == BATCH_PATH:
+        return {"id": sub.id, "status": 400, "body": {"detail": f"Invalid batch URL: {sub.url}"}}
+
+    body = orjson.dumps(sub.body) if sub.body is not None else b""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query.encode(),
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode())
+        ],
+        "client": None,
+        "server": None
+    }
+
+    request_sent = False
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return {"type": "http.disconnect"}
+
+    status = 500
+    chunks = []
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        await app(scope, receive, send)
+    except Exception as e:
+        return {"id": sub.id, "status": 500, "body": {"detail": f"Error executing request: {str(e)}"}}
+
+    raw = b"".join(chunks)
+    try:
+        content = orjson.loads(raw) if raw else None
+    except orjson.JSONDecodeError:
+        content = raw.decode(errors="replace")
+
+    return {"id": sub.id, "status": status, "body": content}
+
+
+@router.post(
+    "/batch",
+    response_model=BatchResponse,
+    summary="Batch Requests",
+    description="Execute several API calls in one round trip"
+)
+async def batch(
+    request: BatchRequest,
+    http_request: Request
+):
+    """
+    Execute multiple API calls concurrently and return all results.
+
+    Each entry is dispatched in-process with its own database session;
+    results are returned in request order with their HTTP status.
+    """
+    responses = await asyncio.gather(*(
+        _dispatch_subrequest(http_request.app, sub) for sub in request.requests
+    ))
+
+    return ORJSONResponse(content={"responses": responses})
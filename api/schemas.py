@@ -1,25 +1,39 @@
 """
 Pydantic schemas for API request and response validation.
 """
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer, WithJsonSchema
+from typing import Annotated, List, Optional, Dict, Any, Literal
 from datetime import datetime
+from database.models import format_timestamp
+
+
+# Allowed values (validated as enums, no per-request regex matching)
+QuestionType = Literal["nash", "minimax", "csp", "search"]
+Difficulty = Literal["easy", "medium", "hard"]
+DetailLevel = Literal["concise", "detailed"]
+
+# Timestamps serialize identically everywhere (ISO 8601 with milliseconds)
+Timestamp = Annotated[
+    datetime,
+    PlainSerializer(format_timestamp, return_type=str),
+    WithJsonSchema({"type": "string", "format": "date-time"})
+]
 
 
 # Request Schemas
 
 class GenerateQuestionsRequest(BaseModel):
     """Request schema for generating questions."""
-    type: str = Field(..., description="Question type: 'nash', 'minimax', 'csp', or 'search'")
+    type: QuestionType = Field(..., description="Question type: 'nash', 'minimax', 'csp', or 'search'")
     count: int = Field(1, ge=1, le=50, description="Number of questions to generate (1-50)")
-    difficulty: str = Field("medium", description="Difficulty level: 'easy', 'medium', or 'hard'")
+    difficulty: Difficulty = Field("medium", description="Difficulty level: 'easy', 'medium', or 'hard'")
     parameters: Optional[Dict[str, Any]] = Field(
         None,
         description="Optional custom parameters (e.g., rows, cols, min_payoff, max_payoff)"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "type": "nash",
                 "count": 5,
@@ -32,6 +46,7 @@ class GenerateQuestionsRequest(BaseModel):
                 }
             }
         }
+    )
 
 
 class EvaluateAnswerRequest(BaseModel):
@@ -39,13 +54,19 @@ class EvaluateAnswerRequest(BaseModel):
     question_id: str = Field(..., description="ID of the question being answered")
     student_answer: str = Field(..., description="Student's answer as text")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "question_id": "nash_a1b2c3d4",
                 "student_answer": "Yes, there is a Nash equilibrium at (U, L)"
             }
         }
+    )
+
+
+class EvaluateAnswersRequest(BaseModel):
+    """Request schema for evaluating several student answers at once."""
+    answers: List[EvaluateAnswerRequest] = Field(..., min_length=1, max_length=500, description="Answers to evaluate")
 
 
 class CreateTestRequest(BaseModel):
@@ -53,13 +74,43 @@ class CreateTestRequest(BaseModel):
     title: str = Field(..., description="Test title")
     question_ids: List[str] = Field(..., min_length=1, description="List of question IDs to include")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "title": "Midterm Exam - Game Theory",
                 "question_ids": ["nash_a1b2c3d4", "nash_e5f6g7h8"]
             }
         }
+    )
+
+
+class BatchSubRequest(BaseModel):
+    """A single API call inside a batch request."""
+    id: str = Field(..., description="Client-chosen identifier, echoed back in the response")
+    method: str = Field("GET", description="HTTP method: 'GET', 'POST' or 'DELETE'")
+    url: str = Field(..., description="API path with optional query string, e.g. '/api/questions?type=nash'")
+    body: Optional[Any] = Field(None, description="JSON body for POST requests")
+
+
+class BatchRequest(BaseModel):
+    """Request schema for executing several API calls in one round trip."""
+    requests: List[BatchSubRequest] = Field(..., min_length=1, max_length=50, description="Calls to execute (1-50)")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "requests": [
+                    {"id": "q1", "method": "GET", "url": "/api/questions/nash_a1b2c3d4"},
+                    {
+                        "id": "gen",
+                        "method": "POST",
+                        "url": "/api/generate-questions",
+                        "body": {"type": "nash", "count": 2, "difficulty": "easy"}
+                    }
+                ]
+            }
+        }
+    )
 
 
 # Response Schemas
@@ -71,10 +122,9 @@ class QuestionResponse(BaseModel):
     difficulty: str
     question_text: str
     question_data: Dict[str, Any]
-    created_at: datetime
+    created_at: Timestamp
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class QuestionListResponse(BaseModel):
@@ -100,10 +150,9 @@ class EvaluationResponse(BaseModel):
     feedback: List[str]
     correct_answer: Optional[Dict[str, Any]] = None
     explanation: Optional[str] = None
-    evaluated_at: datetime
+    evaluated_at: Timestamp
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class EvaluationListResponse(BaseModel):
@@ -116,17 +165,16 @@ class TestResponse(BaseModel):
     """Response schema for a test."""
     id: str
     title: str
-    created_at: datetime
+    created_at: Timestamp
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TestWithQuestionsResponse(BaseModel):
     """Response schema for a test with its questions."""
     id: str
     title: str
-    created_at: datetime
+    created_at: Timestamp
     questions: List[QuestionResponse]
     total_questions: int
 
@@ -156,4 +204,16 @@ class ErrorResponse(BaseModel):
 class SuccessResponse(BaseModel):
     """Generic success response."""
     success: bool
-    message: str
\ No newline at end of file
+    message: str
+
+
+class BatchSubResponse(BaseModel):
+    """Result of a single call inside a batch."""
+    id: str
+    status: int
+    body: Any = None
+
+
+class BatchResponse(BaseModel):
+    """Response schema for a batch request."""
+    responses: List[BatchSubResponse]
\ No newline at end of file
@@ -1,45 +1,97 @@
+from contextlib import asynccontextmanager
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from config import settings
 from database.connection import init_db
-from api.routes import router as api_router
+from api.routes import router as api_router, BATCH_PATH, add_json_body_schemas
+from api.middleware import ResponseCacheMiddleware
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize database and prebuild the OpenAPI schema on application startup."""
+    init_db()
+
+    # Sync endpoints run in this pool; let concurrent requests overlap their DB I/O
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+
+    # Build the schema now (cached on app.openapi_schema) instead of on the first /docs hit
+    if settings.ENABLE_DOCS:
+        app.openapi()
+
+    print("=" * 60)
+    print("✓ Database initialized successfully")
+    print("✓ SmarTest API is ready")
+    print("=" * 60)
+    if settings.ENABLE_DOCS:
+        print("📖 API Documentation: http://localhost:8000/docs")
+        print("📖 Alternative Docs: http://localhost:8000/redoc")
+        print("=" * 60)
+    yield
+
 
 # Create FastAPI app
 app = FastAPI(
     title="SmarTest API",
     description="AI Question Generation and Evaluation System for Artificial Intelligence Course",
     version="1.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc"
+    docs_url="/docs" if settings.ENABLE_DOCS else None,
+    redoc_url="/redoc" if settings.ENABLE_DOCS else None,
+    openapi_url="/openapi.json" if settings.ENABLE_DOCS else None,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
-# Add CORS middleware for frontend
+# Cache GET responses in memory (added before CORS so CORS stays outermost)
+# Batch calls are passed through; their sub-requests hit the cache individually
+app.add_middleware(
+    ResponseCacheMiddleware,
+    prefix="/api",
+    maxsize=1024,
+    maxbytes=64 * 1024 * 1024,
+    ttl=30,
+    passthrough=(BATCH_PATH,),
+    # Only these change cached reads; evaluations never do
+    writes=(
+        ("POST", "/api/generate-questions"),
+        ("POST", "/api/create-test"),
+        ("DELETE", "/api/questions/"),
+        ("DELETE", "/api/tests/"),
+    )
+)
+
+# Add CORS middleware for frontend (added last so it wraps the whole stack)
+# Preflight results are cached by the browser for a day
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, replace with specific origins
+    allow_origins=settings.FRONTEND_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=86400,
 )
 
 # Include API routes
 app.include_router(api_router)
 
+# Generate the OpenAPI document once, with the schemas of bodies parsed by _json_body
+_generate_openapi = app.openapi
 
-@app.on_event("startup")
-def startup_event():
-    """Initialize database on application startup."""
-    init_db()
-    print("=" * 60)
-    print("✓ Database initialized successfully")
-    print("✓ SmarTest API is ready")
-    print("=" * 60)
-    print("📖 API Documentation: http://localhost:8000/docs")
-    print("📖 Alternative Docs: http://localhost:8000/redoc")
-    print("=" * 60)
+
+def openapi():
+    """Build the OpenAPI schema on first use, including _json_body request models."""
+    if app.openapi_schema is None:
+        add_json_body_schemas(_generate_openapi())
+    return app.openapi_schema
+
+
+app.openapi = openapi
 
 
 @app.get("/", tags=["Root"])
-def root():
+async def root():
     """Root endpoint with API information."""
     return {
         "message": "SmarTest API is running!",
@@ -51,7 +103,7 @@ def root():
 
 
 @app.get("/health", tags=["Root"])
-def health_check():
+async def health_check():
     """Health check endpoint."""
     return {
         "status": "healthy",
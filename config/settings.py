@@ -0,0 +1,19 @@
+"""
+Application configuration.
+Values can be overridden with environment variables.
+"""
+import os
+
+# Serve /docs, /redoc and /openapi.json (set SMARTEST_ENABLE_DOCS=0 in production)
+ENABLE_DOCS = os.getenv("SMARTEST_ENABLE_DOCS", "1") == "1"
+
+# Origins allowed to call the API from a browser (comma-separated)
+FRONTEND_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("SMARTEST_FRONTEND_ORIGINS", "http://localhost:5173,http://localhost:3000").split(",")
+    if origin.strip()
+]
+
+# Worker threads for sync endpoints (FastAPI's default is 40); matches the
+# database pool (pool_size + max_overflow) so every connection can be in use
+THREADPOOL_SIZE = int(os.getenv("SMARTEST_THREADPOOL_SIZE", "60"))
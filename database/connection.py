@@ -1,8 +1,9 @@
 """
 Database connection and session management for SQLAlchemy.
 """
-from sqlalchemy import create_engine
+from sqlalchemy import bindparam, create_engine, event, inspect, select, update
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.schema import CreateTable
 from sqlalchemy.orm import sessionmaker
 
 # SQLite database URL
@@ -13,16 +14,46 @@ DATABASE_URL = "sqlite:///./database.db"
 engine = create_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False},
+    pool_size=20,  # WAL lets concurrent readers proceed alongside a writer
+    max_overflow=40,
     echo=False  # Set to True for SQL query logging during development
 )
 
+
+@event.listens_for(engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Tune each new SQLite connection for concurrent reads.
+
+    WAL journaling lets readers run during writes, synchronous=NORMAL is
+    durable under WAL, and memory-mapped I/O plus a larger page cache
+    (64 MB) cut disk access.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.close()
+
 # Create SessionLocal class for database sessions
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Sessions are request-scoped, so objects keep their loaded values after commit
+# instead of being expired and re-SELECTed on the next attribute access
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 # Create Base class for declarative models
 Base = declarative_base()
 
 
+# Indexes from earlier schema versions, removed from existing databases
+SUPERSEDED_INDEXES = (
+    "ix_questions_type",  # leading column of ix_q_type_diff_created
+    "ix_eval_qid",  # leading column of ix_eval_qid_time_score
+    "ix_tq_test_order",  # leading columns of ix_tq_test_order_qid
+)
+
+
 def init_db():
     """
     Initialize database by creating all tables.
@@ -31,6 +62,100 @@ def init_db():
     from database.models import Question, Test, TestQuestion, Evaluation
     Base.metadata.create_all(bind=engine)
 
+    with engine.begin() as connection:
+        # create_all does not add columns to existing tables
+        if "response_blob" not in {c["name"] for c in inspect(connection).get_columns("questions")}:
+            connection.exec_driver_sql("ALTER TABLE questions ADD COLUMN response_blob BLOB")
+            _backfill_response_blobs(connection)
+
+        # Tables created before the timestamp server defaults must get them
+        _add_server_defaults(connection)
+
+        # Drop indexes superseded by the composite ones in models.py
+        for index_name in SUPERSEDED_INDEXES:
+            connection.exec_driver_sql(f"DROP INDEX IF EXISTS {index_name}")
+
+        # create_all skips indexes on tables that already exist
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=connection, checkfirst=True)
+
+        # Refresh planner statistics so SQLite picks the composite indexes
+        connection.exec_driver_sql("ANALYZE")
+
+
+def _backfill_response_blobs(connection):
+    """Build response_blob for questions stored before the column existed."""
+    from database.models import Question, utc_now
+
+    rows = connection.execute(select(
+        Question.id,
+        Question.type,
+        Question.difficulty,
+        Question.question_text,
+        Question.question_data,
+        Question.created_at
+    )).all()
+
+    updates = []
+    for row in rows:
+        question = Question(**row._asdict())
+        if question.created_at is None:
+            question.created_at = utc_now()  # Older schemas allowed NULL timestamps
+        question.set_response_blob()
+        updates.append({
+            "question_id": question.id,
+            "created_at": question.created_at,
+            "response_blob": question.response_blob
+        })
+
+    if updates:
+        connection.execute(
+            update(Question.__table__)
+            .where(Question.__table__.c.id == bindparam("question_id"))
+            .values(created_at=bindparam("created_at"), response_blob=bindparam("response_blob")),
+            updates
+        )
+
+
+def _add_server_defaults(connection):
+    """
+    Rebuild tables whose columns are missing the server defaults in models.py.
+
+    SQLite cannot change a column default in place, so the table is copied
+    into a new one with the current definition (NULLs in those columns get
+    the default), the old table is dropped and the copy renamed. Indexes are
+    recreated afterwards by init_db.
+    """
+    for table in Base.metadata.sorted_tables:
+        existing = {column["name"]: column for column in inspect(connection).get_columns(table.name)}
+        stale = [
+            column.name for column in table.columns
+            if column.server_default is not None
+            and column.name in existing
+            and existing[column.name]["default"] is None
+        ]
+        if not stale:
+            continue
+
+        rebuilt = table.to_metadata(Base.metadata, name=f"{table.name}_rebuilt")
+        try:
+            connection.execute(CreateTable(rebuilt))
+        finally:
+            Base.metadata.remove(rebuilt)
+
+        names = [column.name for column in table.columns if column.name in existing]
+        values = [
+            f"COALESCE({name}, {table.columns[name].server_default.arg.text})" if name in stale else name
+            for name in names
+        ]
+        connection.exec_driver_sql(
+            f"INSERT INTO {rebuilt.name} ({', '.join(names)}) "
+            f"SELECT {', '.join(values)} FROM {table.name}"
+        )
+        connection.exec_driver_sql(f"DROP TABLE {table.name}")
+        connection.exec_driver_sql(f"ALTER TABLE {rebuilt.name} RENAME TO {table.name}")
+
 
 def get_db():
     """
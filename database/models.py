@@ -1,11 +1,26 @@
 """
 SQLAlchemy ORM models for the SmarTest application.
 """
-from sqlalchemy import Column, String, Integer, Text, Float, ForeignKey, DateTime
-from sqlalchemy.orm import relationship
-from datetime import datetime
+from sqlalchemy import Column, String, Integer, Text, Float, ForeignKey, DateTime, Index, LargeBinary, text
+from sqlalchemy.orm import relationship, deferred
 from database.connection import Base
-import json
+from datetime import datetime
+import orjson
+
+# Server-side UTC timestamp with millisecond precision (SQLite CURRENT_TIMESTAMP
+# only has seconds, which would make created_at ordering ambiguous)
+UTC_NOW = text("(STRFTIME('%Y-%m-%d %H:%M:%f', 'now'))")
+
+
+def utc_now() -> datetime:
+    """Current UTC time at the millisecond precision of UTC_NOW."""
+    now = datetime.utcnow()
+    return now.replace(microsecond=now.microsecond // 1000 * 1000)
+
+
+def format_timestamp(value: datetime) -> str:
+    """Serialize a timestamp the way every endpoint returns it: ISO 8601 with milliseconds."""
+    return value.isoformat(timespec="milliseconds")
 
 
 class Question(Base):
@@ -15,33 +30,74 @@ class Question(Base):
     __tablename__ = "questions"
 
     id = Column(String, primary_key=True, index=True)  # e.g., "nash_001"
-    type = Column(String, nullable=False, index=True)  # "nash", "minimax", "csp", "search"
+    type = Column(String, nullable=False)  # "nash", "minimax", "csp", "search"
     difficulty = Column(String, nullable=False)  # "easy", "medium", "hard"
     question_text = Column(Text, nullable=False)  # Human-readable question
     question_data = Column(Text, nullable=False)  # JSON string with type-specific data
-    correct_answer = Column(Text, nullable=False)  # JSON string with computed answer
-    explanation = Column(Text, nullable=True)  # Detailed explanation
-    created_at = Column(DateTime, default=datetime.utcnow)
-
-    # Relationships
-    evaluations = relationship("Evaluation", back_populates="question", cascade="all, delete-orphan")
-    test_associations = relationship("TestQuestion", back_populates="question", cascade="all, delete-orphan")
+    # Heavy columns are deferred: only loaded when accessed or explicitly undeferred
+    correct_answer = deferred(Column(Text, nullable=False), group="answer")  # JSON string with computed answer
+    explanation = deferred(Column(Text, nullable=True), group="answer")  # Detailed explanation
+    response_blob = deferred(Column(LargeBinary, nullable=False))  # Pre-serialized API response JSON
+    created_at = Column(DateTime, server_default=UTC_NOW, nullable=False)
+
+    __table_args__ = (
+        # Serves list filters on type / type+difficulty ordered by created_at
+        Index("ix_q_type_diff_created", "type", "difficulty", "created_at"),
+    )
+
+    # Relationships (never read on request paths; raise instead of lazy-loading)
+    evaluations = relationship(
+        "Evaluation", back_populates="question", cascade="all, delete-orphan", lazy="raise"
+    )
+    test_associations = relationship(
+        "TestQuestion", back_populates="question", cascade="all, delete-orphan", lazy="raise"
+    )
+
+    # Parsed JSON memos (not mapped); stored content is immutable after generation
+    _question_data_cache = None
+    _correct_answer_cache = None
 
     def get_question_data(self):
-        """Parse question_data from JSON string to dict."""
-        return json.loads(self.question_data)
+        """Parse question_data from JSON string to dict (memoized per instance)."""
+        if self._question_data_cache is None:
+            self._question_data_cache = orjson.loads(self.question_data)
+        return self._question_data_cache
 
     def get_correct_answer(self):
-        """Parse correct_answer from JSON string to dict."""
-        return json.loads(self.correct_answer)
+        """Parse correct_answer from JSON string to dict (memoized per instance)."""
+        if self._correct_answer_cache is None:
+            self._correct_answer_cache = orjson.loads(self.correct_answer)
+        return self._correct_answer_cache
 
     def set_question_data(self, data: dict):
         """Convert question_data dict to JSON string."""
-        self.question_data = json.dumps(data)
+        self.question_data = orjson.dumps(data).decode()
+        self._question_data_cache = None
 
     def set_correct_answer(self, answer: dict):
         """Convert correct_answer dict to JSON string."""
-        self.correct_answer = json.dumps(answer)
+        self.correct_answer = orjson.dumps(answer).decode()
+        self._correct_answer_cache = None
+
+    def set_response_blob(self):
+        """
+        Serialize the public question fields into response_blob.
+
+        Called once at write time so read endpoints can return the stored
+        bytes without ORM hydration or JSON parsing. Requires id,
+        question_data and created_at to be set; the already-serialized
+        question_data is spliced in rather than encoded a second time.
+        """
+        head = orjson.dumps({
+            "id": self.id,
+            "type": self.type,
+            "difficulty": self.difficulty,
+            "question_text": self.question_text
+        })
+        tail = orjson.dumps({"created_at": format_timestamp(self.created_at)})
+        self.response_blob = b"".join((
+            head[:-1], b',"question_data":', self.question_data.encode(), b",", tail[1:]
+        ))
 
 
 class Test(Base):
@@ -52,10 +108,18 @@ class Test(Base):
 
     id = Column(String, primary_key=True, index=True)  # e.g., "test_001"
     title = Column(String, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=UTC_NOW, nullable=False)
+
+    # Fetch created_at with INSERT ... RETURNING instead of a refresh SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
     # Relationships
-    question_associations = relationship("TestQuestion", back_populates="test", cascade="all, delete-orphan")
+    question_associations = relationship(
+        "TestQuestion",
+        back_populates="test",
+        cascade="all, delete-orphan",
+        order_by="TestQuestion.order_index"
+    )
 
 
 class TestQuestion(Base):
@@ -70,6 +134,11 @@ class TestQuestion(Base):
     question_id = Column(String, ForeignKey("questions.id"), nullable=False)
     order_index = Column(Integer, nullable=False)  # Order of question in test
 
+    __table_args__ = (
+        # Covering index: ordered question ids of a test without touching table rows
+        Index("ix_tq_test_order_qid", "test_id", "order_index", "question_id"),
+    )
+
     # Relationships
     test = relationship("Test", back_populates="question_associations")
     question = relationship("Question", back_populates="test_associations")
@@ -86,15 +155,29 @@ class Evaluation(Base):
     student_answer = Column(Text, nullable=False)  # Raw student answer text
     score = Column(Float, nullable=False)  # Score from 0 to 100
     feedback = Column(Text, nullable=False)  # JSON array of feedback strings
-    evaluated_at = Column(DateTime, default=datetime.utcnow)
+    evaluated_at = Column(DateTime, server_default=UTC_NOW, nullable=False)
+
+    __table_args__ = (
+        # Covers per-question listing (newest first) and score aggregates
+        Index("ix_eval_qid_time_score", question_id, evaluated_at.desc(), score),
+    )
+
+    # Fetch evaluated_at with INSERT ... RETURNING instead of a refresh SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
     # Relationships
     question = relationship("Question", back_populates="evaluations")
 
+    # Parsed JSON memo (not mapped)
+    _feedback_cache = None
+
     def get_feedback(self):
-        """Parse feedback from JSON string to list."""
-        return json.loads(self.feedback)
+        """Parse feedback from JSON string to list (memoized per instance)."""
+        if self._feedback_cache is None:
+            self._feedback_cache = orjson.loads(self.feedback)
+        return self._feedback_cache
 
     def set_feedback(self, feedback_list: list):
         """Convert feedback list to JSON string."""
-        self.feedback = json.dumps(feedback_list)
\ No newline at end of file
+        self.feedback = orjson.dumps(feedback_list).decode()
+        self._feedback_cache = None
\ No newline at end of file
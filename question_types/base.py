@@ -3,7 +3,7 @@ Abstract base class for all question types.
 Defines the interface that all question types must implement.
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
 class QuestionTypeBase(ABC):
@@ -51,7 +51,8 @@ class QuestionTypeBase(ABC):
         self,
         student_answer: str,
         correct_answer: Dict[str, Any],
-        question_data: Dict[str, Any]
+        question_data: Dict[str, Any],
+        include_explanation: bool = True
     ) -> Dict[str, Any]:
         """
         Evaluate a student's answer against the correct answer.
@@ -60,13 +61,15 @@ class QuestionTypeBase(ABC):
             student_answer: Student's answer as text
             correct_answer: The correct answer
             question_data: The question data structure
+            include_explanation: Build the detailed explanation (callers that
+                already have it stored can pass False to skip the work)
 
         Returns:
             Dictionary containing:
                 - score: Float from 0 to 100
                 - feedback: List of feedback strings
                 - correct_answer: The correct answer
-                - explanation: Detailed explanation
+                - explanation: Detailed explanation, or None if not included
         """
         pass
 
@@ -86,4 +89,20 @@ class QuestionTypeBase(ABC):
         Returns:
             String containing the explanation
         """
-        pass
\ No newline at end of file
+        pass
+
+    def concise_explanation(self, correct_answer: Dict[str, Any]) -> Optional[str]:
+        """
+        Build the concise explanation from a stored correct answer.
+
+        Optional fast path: types whose concise text follows from the answer
+        alone override this; the default returns None, meaning the caller
+        should use answer_question(question_data, "concise").
+
+        Args:
+            correct_answer: The correct answer from generate_answer
+
+        Returns:
+            Concise explanation string, or None if not derivable
+        """
+        return None
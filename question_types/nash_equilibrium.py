@@ -4,10 +4,272 @@ Generates game theory questions about pure Nash equilibria in normal form games.
 """
 import random
 import re
-from typing import Dict, Any, List, Tuple, Optional
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, Any, List, Tuple, Optional, Sequence
 from question_types.base import QuestionTypeBase
 
 
+# One player's payoffs, indexed grid[row][col]
+PayoffGrid = Tuple[Tuple[int, ...], ...]
+
+# Answer parsing patterns, compiled once at import
+
+_EQUILIBRIUM_KEYWORDS = tuple(re.compile(p) for p in (
+    r'\bequilibrium\b',
+    r'\bequilibria\b',
+    r'\bnash\b',
+    r'\bstrategy\s+profile\b'
+))
+
+_EXISTENCE_KEYWORDS = tuple(re.compile(p) for p in (
+    r'\bexists?\b',
+    r'\bthere\s+(?:is|are|isn\'t|aren\'t)\b',
+    r'\byes\b',
+    r'\bno\b',
+    r'\bnone\b',
+    r'\bfound\b',
+    r'\bidentified\b'
+))
+
+_AFFIRMATIVE_START = re.compile(r'^\s*yes\b')
+
+_NEGATION_START = re.compile(r'^\s*no\b')  # "No" at sentence start
+_NEGATION_START_WEIGHT = 10
+
+# Negation patterns with weights (higher = stronger signal)
+_NEGATION_PATTERNS = (
+    # Strong sentence-level negations
+    ('there_is_no', r'\bthere\s+(?:is|are)\s+no\b', 10),  # "there is no", "there are no"
+    ('there_isnt', r'\bthere\s+(?:isn\'t|aren\'t)\b', 10),  # "there isn't", "there aren't"
+
+    # Verb negations
+    ('dont_exist', r'\bdon\'t\s+exist\b', 9),  # "don't exist"
+    ('doesnt_exist', r'\bdo(?:es)?n\'t\s+exist\b', 9),  # "doesn't exist", "don't exist"
+    ('not_exist', r'\bnot\s+exist\b', 9),  # "not exist"
+    ('cannot', r'\bcannot\s+(?:find|be)\b', 8),  # "cannot find", "cannot be"
+    ('cant', r'\bcan\'t\s+(?:find|be)\b', 8),  # "can't find", "can't be"
+
+    # Quantifier negations
+    ('no_equilibrium', r'\bno\s+(?:pure\s+)?(?:nash\s+)?equilibri(?:um|a)\b', 9),  # "no equilibrium", "no pure nash equilibrium"
+    ('none', r'\bnone\b', 8),  # "none"
+    ('neither', r'\bneither\b', 7),  # "neither"
+    ('zero', r'\bzero\s+equilibri', 8),  # "zero equilibria"
+)
+
+# Affirmation patterns with weights
+_AFFIRMATION_PATTERNS = (
+    # Strong affirmations
+    ('equilibrium_exists', r'\bequilibri(?:um|a)\s+(?:does\s+)?exists?\b', 10),  # "equilibrium exists"
+    ('there_is', r'\bthere\s+(?:is|are)\s+(?:a|an|one|two|equilibri)', 10),  # "there is an equilibrium"
+    ('exists_at', r'\bexists?\s+at\b', 9),  # "exists at"
+    ('exists', r'\bexists?\b', 7),  # "exists" alone
+    ('found', r'\b(?:found|identified)\s+(?:a|an|equilibri)', 8),  # "found an equilibrium"
+    ('has', r'\bhas\s+(?:a|an|equilibri)', 7),  # "has an equilibrium"
+)
+
+# All weighted patterns fused into one scan. Each alternative is a zero-width
+# lookahead, so overlapping phrases ("equilibrium exists at") are all seen.
+_CLAIM_RE = re.compile("|".join(
+    f"(?=(?P<{name}>{pattern}))"
+    for name, pattern, _ in _NEGATION_PATTERNS + _AFFIRMATION_PATTERNS
+))
+_NEGATION_WEIGHTS = {name: weight for name, _, weight in _NEGATION_PATTERNS}
+_AFFIRMATION_WEIGHTS = {name: weight for name, _, weight in _AFFIRMATION_PATTERNS}
+
+# Only the first matching alternative is reported at a given position; these
+# patterns always match wherever their key matches, so they are added back
+_IMPLIED_CLAIMS = {
+    'dont_exist': 'doesnt_exist',
+    'exists_at': 'exists',
+}
+
+
+@lru_cache(maxsize=256)
+def _position_parser(
+    row_labels: Tuple[str, ...],
+    col_labels: Tuple[str, ...]
+) -> Tuple[re.Pattern, Dict[str, int], Dict[str, int]]:
+    """
+    Build the "(row, col)" position pattern and label index maps for a set of labels.
+
+    Returns:
+        Tuple of (compiled pattern, row label -> index, col label -> index)
+    """
+    row_pattern = "|".join(re.escape(label) for label in row_labels)
+    col_pattern = "|".join(re.escape(label) for label in col_labels)
+    pattern = re.compile(rf'\(({row_pattern})\s*,\s*({col_pattern})\)', re.IGNORECASE)
+    row_index = {label: idx for idx, label in enumerate(row_labels)}
+    col_index = {label: idx for idx, label in enumerate(col_labels)}
+    return pattern, row_index, col_index
+
+
+def _payoff_records(payoffs: Tuple[int, ...]) -> Tuple[List[int], List[int]]:
+    """
+    Running-maximum records of one row or column.
+
+    Returns:
+        Tuple of (record payoffs, their indices): each payoff that is strictly
+        greater than every payoff before it, in increasing order
+    """
+    values, indices = [], []
+    for idx, payoff in enumerate(payoffs):
+        if not values or payoff > values[-1]:
+            values.append(payoff)
+            indices.append(idx)
+    return values, indices
+
+
+def _first_better(records: Tuple[List[int], List[int]], payoff: int) -> Optional[int]:
+    """
+    Index of the first strategy paying strictly more than `payoff`, or None.
+
+    The first strictly better entry always beats everything before it, so it
+    is the first record above `payoff`.
+    """
+    values, indices = records
+    k = bisect_right(values, payoff)
+    return indices[k] if k < len(values) else None
+
+
+def _nash_equilibria(
+    p1: PayoffGrid,
+    p2: PayoffGrid,
+    rows: int,
+    cols: int
+) -> Tuple[Tuple[int, int], ...]:
+    """
+    Core Nash equilibrium detection algorithm.
+
+    A cell (i, j) is a Nash equilibrium iff:
+      1. Player 1's payoff is the maximum of column j (best response to j)
+      2. Player 2's payoff is the maximum of row i (best response to i)
+
+    Columns are scanned once for Player 1's best responses. Player 2's row
+    maximum is only computed for rows that are a best response somewhere, so
+    rows that never are (which includes every strictly dominated row) are
+    pruned without a separate dominance pass.
+
+    Returns:
+        Tuple of (row_index, col_index) tuples representing Nash equilibria,
+        in row-major order
+    """
+    equilibria = []
+    row_max_p2 = {}
+
+    # zip(*p1) transposes in C, yielding Player 1's payoffs column by column
+    for j, column in enumerate(zip(*p1)):
+        p1_max = max(column)
+
+        for i, payoff in enumerate(column):
+            if payoff != p1_max:
+                continue
+
+            # Best payoff Player 2 can get against row i (computed on first use)
+            p2_max = row_max_p2.get(i)
+            if p2_max is None:
+                p2_max = row_max_p2[i] = max(p2[i])
+
+            if p2[i][j] == p2_max:
+                equilibria.append((i, j))
+
+    return tuple(sorted(equilibria))
+
+
+def _concise_explanation(
+    equilibria: Sequence[Sequence[int]],
+    row_labels: Sequence[str],
+    col_labels: Sequence[str]
+) -> str:
+    """One-line verdict listing the equilibria, if any."""
+    if equilibria:
+        eq_list = [f"({row_labels[r]}, {col_labels[c]})" for r, c in equilibria]
+        return f"Yes, pure Nash equilibrium exists at: {', '.join(eq_list)}"
+    else:
+        return "No pure Nash equilibrium exists in this game."
+
+
+def _explanation(
+    p1: PayoffGrid,
+    p2: PayoffGrid,
+    row_labels: Tuple[str, ...],
+    col_labels: Tuple[str, ...],
+    detail_level: str
+) -> str:
+    """
+    Build the solution explanation for a game.
+
+    Not memoized: detailed text is stored on the question after the first
+    build and concise text is derived from the stored answer, so repeat
+    calls are rare and caching would only pin large strings in memory.
+
+    Returns:
+        Explanation string
+    """
+    rows, cols = len(p1), len(p1[0])
+    equilibria = _nash_equilibria(p1, p2, rows, cols)
+
+    if detail_level == "concise":
+        return _concise_explanation(equilibria, row_labels, col_labels)
+
+    # Detailed explanation
+    explanation = ["NASH EQUILIBRIUM ANALYSIS", "=" * 50, ""]
+    explanation.append("A Nash equilibrium is a strategy profile where no player can improve")
+    explanation.append("their payoff by unilaterally changing their strategy.\n")
+    explanation.append("Checking each cell (strategy profile):\n")
+
+    p1_best_msg = "  Player 1: ✓ Best response (no better alternative)"
+    p2_best_msg = "  Player 2: ✓ Best response (no better alternative)"
+    not_equilibrium_msg = "  >>> Not a Nash equilibrium"
+
+    # Running-maximum records per column (Player 1) and per row (Player 2)
+    col_records_p1 = [_payoff_records(column) for column in zip(*p1)]
+    row_records_p2 = [_payoff_records(row) for row in p2]
+
+    # One formatted block per cell (the trailing newline leaves a blank line)
+    for i in range(rows):
+        row_label = row_labels[i]
+        for j in range(cols):
+            col_label = col_labels[j]
+            p1_payoff = p1[i][j]
+            p2_payoff = p2[i][j]
+
+            # First strictly better alternative for each player, if any
+            p1_alt = _first_better(col_records_p1[j], p1_payoff)
+            p2_alt = _first_better(row_records_p2[i], p2_payoff)
+
+            if p1_alt is None:
+                p1_msg = p1_best_msg
+            else:
+                p1_msg = f"  Player 1: NOT best response (can get {p1[p1_alt][j]} by switching to {row_labels[p1_alt]})"
+
+            if p2_alt is None:
+                p2_msg = p2_best_msg
+            else:
+                p2_msg = f"  Player 2: NOT best response (can get {p2[i][p2_alt]} by switching to {col_labels[p2_alt]})"
+
+            if p1_alt is None and p2_alt is None:
+                verdict = f"  >>> NASH EQUILIBRIUM at ({row_label}, {col_label}) ✓"
+            else:
+                verdict = not_equilibrium_msg
+
+            explanation.append(
+                f"Cell ({row_label}, {col_label}): Payoffs = ({p1_payoff}, {p2_payoff})\n"
+                f"{p1_msg}\n{p2_msg}\n{verdict}\n"
+            )
+
+    # Final summary
+    explanation.append("=" * 50)
+    explanation.append("CONCLUSION:")
+    if equilibria:
+        eq_list = [f"({row_labels[r]}, {col_labels[c]})" for r, c in equilibria]
+        explanation.append(f"Pure Nash equilibrium exists at: {', '.join(eq_list)}")
+    else:
+        explanation.append("No pure Nash equilibrium exists in this game.")
+
+    return "\n".join(explanation)
+
+
 class NashEquilibrium(QuestionTypeBase):
     """
     Nash Equilibrium question generator and evaluator.
@@ -33,16 +295,16 @@ class NashEquilibrium(QuestionTypeBase):
         min_payoff = kwargs.get('min_payoff', 0)
         max_payoff = kwargs.get('max_payoff', 10)
 
-        # Generate random payoff matrix
-        matrix = self._generate_random_matrix(rows, cols, min_payoff, max_payoff)
+        # Generate random payoff grids
+        p1, p2 = self._generate_random_matrix(rows, cols, min_payoff, max_payoff)
 
         # Generate labels for rows and columns
         row_labels = self._generate_labels(rows, 'row')
         col_labels = self._generate_labels(cols, 'col')
 
-        # Create question data
+        # Create question data (the matrix is stored in its "row,col" JSON form)
         question_data = {
-            'matrix': matrix,
+            'matrix': self._payoff_dict(p1, p2),
             'rows': rows,
             'cols': cols,
             'row_labels': row_labels,
@@ -50,10 +312,11 @@ class NashEquilibrium(QuestionTypeBase):
         }
 
         # Compute correct answer immediately
-        correct_answer = self.generate_answer(question_data)
+        equilibria = self._find_nash_equilibria(p1, p2, rows, cols)
+        correct_answer = self._build_answer(equilibria, row_labels, col_labels)
 
         # Format human-readable question text
-        question_text = self._format_question_text(matrix, rows, cols, row_labels, col_labels)
+        question_text = self._format_question_text(p1, p2, rows, cols, row_labels, col_labels)
 
         return {
             'type': 'nash',
@@ -77,25 +340,25 @@ class NashEquilibrium(QuestionTypeBase):
                 - row_labels: labels for rows
                 - col_labels: labels for columns
         """
-        matrix = question_data['matrix']
         rows = question_data['rows']
         cols = question_data['cols']
+        p1, p2 = self._payoff_grid(question_data['matrix'], rows, cols)
 
         # Find all Nash equilibria
-        equilibria = self._find_nash_equilibria(matrix, rows, cols)
+        equilibria = self._find_nash_equilibria(p1, p2, rows, cols)
 
-        return {
-            'exists': len(equilibria) > 0,
-            'equilibria': equilibria,
-            'row_labels': question_data.get('row_labels', []),
-            'col_labels': question_data.get('col_labels', [])
-        }
+        return self._build_answer(
+            equilibria,
+            question_data.get('row_labels', []),
+            question_data.get('col_labels', [])
+        )
 
     def evaluate_answer(
         self,
         student_answer: str,
         correct_answer: Dict[str, Any],
-        question_data: Dict[str, Any]
+        question_data: Dict[str, Any],
+        include_explanation: bool = True
     ) -> Dict[str, Any]:
         """
         Evaluate student's answer with partial credit.
@@ -109,6 +372,8 @@ class NashEquilibrium(QuestionTypeBase):
         """
         feedback = []
         score = 0.0
+        row_labels = question_data.get('row_labels', [])
+        col_labels = question_data.get('col_labels', [])
 
         # Parse student answer
         student_exists, student_positions = self._parse_student_answer(
@@ -116,7 +381,6 @@ class NashEquilibrium(QuestionTypeBase):
         )
 
         correct_exists = correct_answer['exists']
-        correct_positions = set(map(tuple, correct_answer['equilibria']))
 
         # Score existence (50 points)
         if student_exists == correct_exists:
@@ -133,6 +397,8 @@ class NashEquilibrium(QuestionTypeBase):
 
         # Score positions (50 points) - only if equilibria exist
         if correct_exists:
+            # Stored equilibria are JSON lists; compare as tuples
+            correct_positions = set(map(tuple, correct_answer['equilibria']))
             student_positions_set = set(student_positions)
 
             # True positives (correctly found equilibria)
@@ -162,20 +428,14 @@ class NashEquilibrium(QuestionTypeBase):
 
                 # Detailed feedback
                 if correct_found:
-                    row_labels = question_data.get('row_labels', [])
-                    col_labels = question_data.get('col_labels', [])
                     found_list = [f"({row_labels[r]}, {col_labels[c]})" for r, c in correct_found]
                     feedback.append(f"~ Partial: Correctly found {len(correct_found)}/{total_correct} equilibria: {', '.join(found_list)}")
 
                 if incorrect_found:
-                    row_labels = question_data.get('row_labels', [])
-                    col_labels = question_data.get('col_labels', [])
                     incorrect_list = [f"({row_labels[r]}, {col_labels[c]})" for r, c in incorrect_found]
                     feedback.append(f"✗ Error: Incorrectly identified {len(incorrect_found)} non-equilibria: {', '.join(incorrect_list)}")
 
                 if missed:
-                    row_labels = question_data.get('row_labels', [])
-                    col_labels = question_data.get('col_labels', [])
                     missed_list = [f"({row_labels[r]}, {col_labels[c]})" for r, c in missed]
                     feedback.append(f"✗ Missed: {len(missed)} equilibria not found: {', '.join(missed_list)}")
 
@@ -183,7 +443,7 @@ class NashEquilibrium(QuestionTypeBase):
             'score': round(score, 2),
             'feedback': feedback,
             'correct_answer': correct_answer,
-            'explanation': self.answer_question(question_data, 'detailed')
+            'explanation': self.answer_question(question_data, 'detailed') if include_explanation else None
         }
 
     def answer_question(
@@ -201,79 +461,32 @@ class NashEquilibrium(QuestionTypeBase):
         Returns:
             Explanation string
         """
-        matrix = question_data['matrix']
         rows = question_data['rows']
         cols = question_data['cols']
         row_labels = question_data.get('row_labels', [str(i) for i in range(rows)])
         col_labels = question_data.get('col_labels', [str(j) for j in range(cols)])
+        p1, p2 = self._payoff_grid(question_data['matrix'], rows, cols)
 
-        equilibria = self._find_nash_equilibria(matrix, rows, cols)
+        return _explanation(p1, p2, tuple(row_labels), tuple(col_labels), detail_level)
 
-        if detail_level == "concise":
-            if equilibria:
-                eq_list = [f"({row_labels[r]}, {col_labels[c]})" for r, c in equilibria]
-                return f"Yes, pure Nash equilibrium exists at: {', '.join(eq_list)}"
-            else:
-                return "No pure Nash equilibrium exists in this game."
+    def concise_explanation(self, correct_answer: Dict[str, Any]) -> Optional[str]:
+        """
+        Build the concise explanation from a stored correct answer.
 
-        # Detailed explanation
-        explanation = ["NASH EQUILIBRIUM ANALYSIS", "=" * 50, ""]
-        explanation.append("A Nash equilibrium is a strategy profile where no player can improve")
-        explanation.append("their payoff by unilaterally changing their strategy.\n")
-        explanation.append("Checking each cell (strategy profile):\n")
+        The answer already lists the equilibria and labels, so no payoff
+        matrix is parsed and no game is solved.
 
-        for i in range(rows):
-            for j in range(cols):
-                row_label = row_labels[i]
-                col_label = col_labels[j]
-                p1_payoff, p2_payoff = matrix[f"{i},{j}"]
-
-                explanation.append(f"Cell ({row_label}, {col_label}): Payoffs = ({p1_payoff}, {p2_payoff})")
-
-                # Check Player 1 best response
-                p1_best = True
-                for alt_i in range(rows):
-                    if alt_i != i:
-                        alt_payoff = matrix[f"{alt_i},{j}"][0]
-                        if alt_payoff > p1_payoff:
-                            p1_best = False
-                            explanation.append(f"  Player 1: NOT best response (can get {alt_payoff} by switching to {row_labels[alt_i]})")
-                            break
-
-                if p1_best:
-                    explanation.append(f"  Player 1: ✓ Best response (no better alternative)")
-
-                # Check Player 2 best response
-                p2_best = True
-                for alt_j in range(cols):
-                    if alt_j != j:
-                        alt_payoff = matrix[f"{i},{alt_j}"][1]
-                        if alt_payoff > p2_payoff:
-                            p2_best = False
-                            explanation.append(f"  Player 2: NOT best response (can get {alt_payoff} by switching to {col_labels[alt_j]})")
-                            break
-
-                if p2_best:
-                    explanation.append(f"  Player 2: ✓ Best response (no better alternative)")
-
-                # Conclusion for this cell
-                if p1_best and p2_best:
-                    explanation.append(f"  >>> NASH EQUILIBRIUM at ({row_label}, {col_label}) ✓")
-                else:
-                    explanation.append(f"  >>> Not a Nash equilibrium")
-
-                explanation.append("")
-
-        # Final summary
-        explanation.append("=" * 50)
-        explanation.append("CONCLUSION:")
-        if equilibria:
-            eq_list = [f"({row_labels[r]}, {col_labels[c]})" for r, c in equilibria]
-            explanation.append(f"Pure Nash equilibrium exists at: {', '.join(eq_list)}")
-        else:
-            explanation.append("No pure Nash equilibrium exists in this game.")
+        Args:
+            correct_answer: The correct answer from generate_answer
 
-        return "\n".join(explanation)
+        Returns:
+            Concise explanation string
+        """
+        return _concise_explanation(
+            correct_answer['equilibria'],
+            correct_answer['row_labels'],
+            correct_answer['col_labels']
+        )
 
     # Helper methods
 
@@ -295,26 +508,83 @@ class NashEquilibrium(QuestionTypeBase):
         else:  # hard
             return random.choice([3, 4])
 
+    @staticmethod
+    def _build_answer(
+        equilibria: List[Tuple[int, int]],
+        row_labels: List[str],
+        col_labels: List[str]
+    ) -> Dict[str, Any]:
+        """Assemble the correct-answer dict from the found equilibria."""
+        return {
+            'exists': len(equilibria) > 0,
+            'equilibria': equilibria,
+            'row_labels': row_labels,
+            'col_labels': col_labels
+        }
+
     def _generate_random_matrix(
         self,
         rows: int,
         cols: int,
         min_payoff: int,
         max_payoff: int
-    ) -> Dict[str, Tuple[int, int]]:
+    ) -> Tuple[PayoffGrid, PayoffGrid]:
         """
         Generate random payoff matrix.
 
+        Returns:
+            Tuple of (player1_grid, player2_grid), each indexed grid[row][col]
+
+        Raises:
+            ValueError: If min_payoff is greater than max_payoff
+        """
+        if min_payoff > max_payoff:
+            raise ValueError(f"min_payoff ({min_payoff}) must not exceed max_payoff ({max_payoff})")
+
+        # Draw every payoff in one call: the first half for Player 1, the rest for Player 2
+        size = rows * cols
+        payoffs = random.choices(range(min_payoff, max_payoff + 1), k=2 * size)
+        return (
+            tuple(tuple(payoffs[i * cols:(i + 1) * cols]) for i in range(rows)),
+            tuple(tuple(payoffs[size + i * cols:size + (i + 1) * cols]) for i in range(rows))
+        )
+
+    @staticmethod
+    def _payoff_grid(
+        matrix: Dict[str, Tuple[int, int]],
+        rows: int,
+        cols: int
+    ) -> Tuple[PayoffGrid, PayoffGrid]:
+        """
+        Convert the stored "row,col" payoff dict into integer-indexed grids.
+
+        The dict form is what gets persisted as JSON; converting it once lets
+        the analysis loops use p1[i][j] instead of building and hashing a
+        string key on every access. Each player's payoffs are kept in their
+        own grid, since every check reads only one player's payoffs.
+
+        Returns:
+            Tuple of (player1_grid, player2_grid), each indexed grid[row][col]
+        """
+        cells = [[matrix[f"{i},{j}"] for j in range(cols)] for i in range(rows)]
+        return (
+            tuple(tuple(payoffs[0] for payoffs in row) for row in cells),
+            tuple(tuple(payoffs[1] for payoffs in row) for row in cells)
+        )
+
+    @staticmethod
+    def _payoff_dict(p1: PayoffGrid, p2: PayoffGrid) -> Dict[str, Tuple[int, int]]:
+        """
+        Convert payoff grids into the "row,col" dict stored in question_data.
+
         Returns:
             Dictionary mapping "row,col" to (player1_payoff, player2_payoff)
         """
-        matrix = {}
-        for i in range(rows):
-            for j in range(cols):
-                p1_payoff = random.randint(min_payoff, max_payoff)
-                p2_payoff = random.randint(min_payoff, max_payoff)
-                matrix[f"{i},{j}"] = (p1_payoff, p2_payoff)
-        return matrix
+        return {
+            f"{i},{j}": payoffs
+            for i, (p1_row, p2_row) in enumerate(zip(p1, p2))
+            for j, payoffs in enumerate(zip(p1_row, p2_row))
+        }
 
     def _generate_labels(self, count: int, label_type: str) -> List[str]:
         """
@@ -340,7 +610,8 @@ class NashEquilibrium(QuestionTypeBase):
 
     def _format_question_text(
         self,
-        matrix: Dict[str, Tuple[int, int]],
+        p1: PayoffGrid,
+        p2: PayoffGrid,
         rows: int,
         cols: int,
         row_labels: List[str],
@@ -366,8 +637,7 @@ class NashEquilibrium(QuestionTypeBase):
             row_label = row_labels[i]
             cells = []
             for j in range(cols):
-                p1, p2 = matrix[f"{i},{j}"]
-                cells.append(f"({p1:>2},{p2:>2})")
+                cells.append(f"({p1[i][j]:>2},{p2[i][j]:>2})")
             row_line = f"{row_label:>2} |" + "  ".join(f"{cell:>8}" for cell in cells)
             lines.append(row_line)
 
@@ -378,50 +648,18 @@ class NashEquilibrium(QuestionTypeBase):
 
     def _find_nash_equilibria(
         self,
-        matrix: Dict[str, Tuple[int, int]],
+        p1: PayoffGrid,
+        p2: PayoffGrid,
         rows: int,
         cols: int
     ) -> List[Tuple[int, int]]:
         """
-        Core Nash equilibrium detection algorithm.
-
-        For each cell (i, j):
-          1. Check if Player 1 is best responding (fix column j, compare rows)
-          2. Check if Player 2 is best responding (fix row i, compare columns)
-          3. If both are best responding, it's a Nash equilibrium
+        Find all pure Nash equilibria of the game.
 
         Returns:
             List of (row_index, col_index) tuples representing Nash equilibria
         """
-        equilibria = []
-
-        for i in range(rows):
-            for j in range(cols):
-                p1_payoff, p2_payoff = matrix[f"{i},{j}"]
-
-                # Check if Player 1 is best responding
-                p1_best_response = True
-                for alt_i in range(rows):
-                    if alt_i != i:
-                        alt_p1_payoff = matrix[f"{alt_i},{j}"][0]
-                        if alt_p1_payoff > p1_payoff:
-                            p1_best_response = False
-                            break
-
-                # Check if Player 2 is best responding
-                p2_best_response = True
-                for alt_j in range(cols):
-                    if alt_j != j:
-                        alt_p2_payoff = matrix[f"{i},{alt_j}"][1]
-                        if alt_p2_payoff > p2_payoff:
-                            p2_best_response = False
-                            break
-
-                # Both best responding? -> Nash equilibrium
-                if p1_best_response and p2_best_response:
-                    equilibria.append((i, j))
-
-        return equilibria
+        return list(_nash_equilibria(p1, p2, rows, cols))
 
     def _parse_student_answer(
         self,
@@ -468,28 +706,11 @@ class NashEquilibrium(QuestionTypeBase):
             None - no clear claim
         """
         # Check for equilibrium-related keywords
-        equilibrium_keywords = [
-            r'\bequilibrium\b',
-            r'\bequilibria\b',
-            r'\bnash\b',
-            r'\bstrategy\s+profile\b'
-        ]
-
-        if any(re.search(kw, answer_lower) for kw in equilibrium_keywords):
+        if any(kw.search(answer_lower) for kw in _EQUILIBRIUM_KEYWORDS):
             return "equilibrium_mentioned"
 
         # Check for existence/quantifier words that imply a claim about equilibrium
-        existence_keywords = [
-            r'\bexists?\b',
-            r'\bthere\s+(?:is|are|isn\'t|aren\'t)\b',
-            r'\byes\b',
-            r'\bno\b',
-            r'\bnone\b',
-            r'\bfound\b',
-            r'\bidentified\b'
-        ]
-
-        if any(re.search(kw, answer_lower) for kw in existence_keywords):
+        if any(kw.search(answer_lower) for kw in _EXISTENCE_KEYWORDS):
             return "equilibrium_mentioned"
 
         return None
@@ -504,50 +725,20 @@ class NashEquilibrium(QuestionTypeBase):
             False if affirmed (equilibrium exists)
         """
         # Check for strong sentence-initial affirmations first (highest priority)
-        if re.match(r'^\s*yes\b', answer_lower):
+        if _AFFIRMATIVE_START.match(answer_lower):
             return False  # Definitely affirmed
 
-        # Negation patterns with weights (higher = stronger signal)
-        negation_patterns = [
-            # Strong sentence-level negations
-            (r'^\s*no\b', 10),  # "No" at sentence start
-            (r'\bthere\s+(?:is|are)\s+no\b', 10),  # "there is no", "there are no"
-            (r'\bthere\s+(?:isn\'t|aren\'t)\b', 10),  # "there isn't", "there aren't"
-
-            # Verb negations
-            (r'\bdo(?:es)?n\'t\s+exist\b', 9),  # "doesn't exist", "don't exist"
-            (r'\bdon\'t\s+exist\b', 9),  # "don't exist"
-            (r'\bnot\s+exist\b', 9),  # "not exist"
-            (r'\bcannot\s+(?:find|be)\b', 8),  # "cannot find", "cannot be"
-            (r'\bcan\'t\s+(?:find|be)\b', 8),  # "can't find", "can't be"
-
-            # Quantifier negations
-            (r'\bno\s+(?:pure\s+)?(?:nash\s+)?equilibri(?:um|a)\b', 9),  # "no equilibrium", "no pure nash equilibrium"
-            (r'\bnone\b', 8),  # "none"
-            (r'\bneither\b', 7),  # "neither"
-            (r'\bzero\s+equilibri', 8),  # "zero equilibria"
-        ]
-
-        # Affirmation patterns with weights
-        affirmation_patterns = [
-            # Strong affirmations
-            (r'\bequilibri(?:um|a)\s+(?:does\s+)?exists?\b', 10),  # "equilibrium exists"
-            (r'\bthere\s+(?:is|are)\s+(?:a|an|one|two|equilibri)', 10),  # "there is an equilibrium"
-            (r'\bexists?\s+at\b', 9),  # "exists at"
-            (r'\bexists?\b', 7),  # "exists" alone
-            (r'\b(?:found|identified)\s+(?:a|an|equilibri)', 8),  # "found an equilibrium"
-            (r'\bhas\s+(?:a|an|equilibri)', 7),  # "has an equilibrium"
-        ]
+        # Collect every weighted pattern present in a single pass
+        found = {match.lastgroup for match in _CLAIM_RE.finditer(answer_lower)}
+        for name, implied in _IMPLIED_CLAIMS.items():
+            if name in found:
+                found.add(implied)
 
         # Calculate weighted scores
-        negation_score = sum(
-            weight for pattern, weight in negation_patterns
-            if re.search(pattern, answer_lower)
-        )
-        affirmation_score = sum(
-            weight for pattern, weight in affirmation_patterns
-            if re.search(pattern, answer_lower)
-        )
+        negation_score = sum(_NEGATION_WEIGHTS.get(name, 0) for name in found)
+        if _NEGATION_START.match(answer_lower):
+            negation_score += _NEGATION_START_WEIGHT
+        affirmation_score = sum(_AFFIRMATION_WEIGHTS.get(name, 0) for name in found)
 
         # Return True if negation score is higher (meaning "doesn't exist")
         return negation_score > affirmation_score
@@ -569,20 +760,14 @@ class NashEquilibrium(QuestionTypeBase):
         if not row_labels or not col_labels:
             return positions
 
-        # Create pattern from labels
-        row_pattern = "|".join(re.escape(label) for label in row_labels)
-        col_pattern = "|".join(re.escape(label) for label in col_labels)
-        pattern = rf'\(({row_pattern})\s*,\s*({col_pattern})\)'
-
-        matches = re.findall(pattern, student_answer, re.IGNORECASE)
+        pattern, row_index, col_index = _position_parser(tuple(row_labels), tuple(col_labels))
+        matches = pattern.findall(student_answer)
 
         for row_label, col_label in matches:
             # Find indices
-            try:
-                row_idx = row_labels.index(row_label.upper())
-                col_idx = col_labels.index(col_label.upper())
+            row_idx = row_index.get(row_label.upper())
+            col_idx = col_index.get(col_label.upper())
+            if row_idx is not None and col_idx is not None:
                 positions.append((row_idx, col_idx))
-            except ValueError:
-                continue
 
         return positions
\ No newline at end of file
@@ -1,11 +1,21 @@
 """
 Service layer for answer evaluation.
 """
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Session, undefer_group
 from database.models import Evaluation, Question
 from services.question_service import QuestionService
-from typing import Optional, Dict, Any
-import uuid
+from typing import Optional, Dict, Any, List, Tuple
+from dataclasses import dataclass
+import secrets
+
+
+@dataclass
+class EvaluationResult:
+    """A saved evaluation plus response-only data that is not persisted."""
+    evaluation: Evaluation
+    correct_answer: Dict[str, Any]
+    explanation: str
 
 
 class EvaluationService:
@@ -16,7 +26,7 @@ class EvaluationService:
         db: Session,
         question_id: str,
         student_answer: str
-    ) -> Optional[Evaluation]:
+    ) -> Optional[EvaluationResult]:
         """
         Evaluate a student's answer and save the evaluation.
 
@@ -26,58 +36,106 @@ class EvaluationService:
             student_answer: Student's answer as text
 
         Returns:
-            Evaluation object with score and feedback, or None if question not found
+            EvaluationResult with the saved evaluation, correct answer and
+            explanation, or None if question not found
 
         Raises:
             ValueError: If question type is not supported
         """
-        # Get the question
-        question = QuestionService.get_question(db, question_id)
-
-        if not question:
-            return None
-
-        # Get the question type generator
-        if question.type not in QuestionService.QUESTION_TYPES:
-            raise ValueError(f"Unsupported question type: {question.type}")
-
-        generator = QuestionService.QUESTION_TYPES[question.type]
+        results = EvaluationService.evaluate_answers_bulk(db, [(question_id, student_answer)])
+        return results[0] if results else None
 
-        # Get question data and correct answer
-        question_data = question.get_question_data()
-        correct_answer = question.get_correct_answer()
+    @staticmethod
+    def evaluate_answers_bulk(
+        db: Session,
+        answers: List[Tuple[str, str]]
+    ) -> Optional[List[EvaluationResult]]:
+        """
+        Evaluate many student answers with a fixed number of queries.
 
-        # Evaluate the answer
-        evaluation_result = generator.evaluate_answer(
-            student_answer,
-            correct_answer,
-            question_data
-        )
+        Questions are loaded with one IN query and all evaluations are saved
+        in a single commit; their server-generated evaluated_at comes back
+        from the INSERT itself (RETURNING, via eager_defaults).
 
-        # Create evaluation ID
-        evaluation_id = f"eval_{uuid.uuid4().hex[:8]}"
+        Args:
+            db: Database session
+            answers: List of (question_id, student_answer) pairs
 
-        # Create database model
-        evaluation = Evaluation(
-            id=evaluation_id,
-            question_id=question_id,
-            student_answer=student_answer,
-            score=evaluation_result['score']
-        )
+        Returns:
+            List of EvaluationResult in input order, or None if any question
+            is not found (nothing is saved in that case)
 
-        # Set feedback JSON
-        evaluation.set_feedback(evaluation_result['feedback'])
+        Raises:
+            ValueError: If a question type is not supported
+        """
+        # Get all referenced questions at once
+        question_ids = {question_id for question_id, _ in answers}
+        questions = {
+            question.id: question
+            for question in (
+                db.query(Question)
+                .options(undefer_group("answer"))
+                .filter(Question.id.in_(question_ids))
+                .all()
+            )
+        }
+
+        if len(questions) != len(question_ids):
+            return None
 
-        # Save to database
-        db.add(evaluation)
+        # Resolve each question's generator once per batch
+        generators = {
+            question_id: QuestionService.get_generator(question.type)
+            for question_id, question in questions.items()
+        }
+
+        results = []
+
+        for question_id, student_answer in answers:
+            question = questions[question_id]
+            generator = generators[question_id]
+
+            # Get question data and correct answer (parsed once per question)
+            question_data = question.get_question_data()
+            correct_answer = question.get_correct_answer()
+
+            # Evaluate the answer (the detailed explanation comes from the question)
+            evaluation_result = generator.evaluate_answer(
+                student_answer,
+                correct_answer,
+                question_data,
+                include_explanation=False
+            )
+
+            # Create evaluation ID
+            evaluation_id = f"eval_{secrets.token_hex(4)}"
+
+            # Create database model
+            evaluation = Evaluation(
+                id=evaluation_id,
+                question_id=question_id,
+                student_answer=student_answer,
+                score=evaluation_result['score']
+            )
+
+            # Set feedback JSON
+            evaluation.set_feedback(evaluation_result['feedback'])
+
+            # Explanations are generated lazily; persist it with this commit
+            if question.explanation is None:
+                question.explanation = generator.answer_question(question_data, 'detailed')
+
+            results.append(EvaluationResult(
+                evaluation=evaluation,
+                correct_answer=correct_answer,
+                explanation=question.explanation
+            ))
+
+        # Save to database (evaluated_at comes back through INSERT ... RETURNING)
+        db.add_all(result.evaluation for result in results)
         db.commit()
-        db.refresh(evaluation)
-
-        # Add additional data for response (not stored in DB)
-        evaluation._correct_answer = correct_answer
-        evaluation._explanation = evaluation_result['explanation']
 
-        return evaluation
+        return results
 
     @staticmethod
     def get_evaluation(db: Session, evaluation_id: str) -> Optional[Evaluation]:
@@ -91,7 +149,7 @@ class EvaluationService:
         Returns:
             Evaluation object or None if not found
         """
-        return db.query(Evaluation).filter(Evaluation.id == evaluation_id).first()
+        return db.get(Evaluation, evaluation_id)
 
     @staticmethod
     def get_evaluations_for_question(
@@ -130,9 +188,19 @@ class EvaluationService:
         Returns:
             Dictionary with statistics (count, average score, etc.)
         """
-        evaluations = EvaluationService.get_evaluations_for_question(db, question_id)
+        # Aggregate in SQL over all evaluations (no rows are loaded)
+        count, average, minimum, maximum = (
+            db.query(
+                func.count(Evaluation.score),
+                func.avg(Evaluation.score),
+                func.min(Evaluation.score),
+                func.max(Evaluation.score)
+            )
+            .filter(Evaluation.question_id == question_id)
+            .one()
+        )
 
-        if not evaluations:
+        if not count:
             return {
                 'question_id': question_id,
                 'total_evaluations': 0,
@@ -141,12 +209,10 @@ class EvaluationService:
                 'max_score': 0.0
             }
 
-        scores = [e.score for e in evaluations]
-
         return {
             'question_id': question_id,
-            'total_evaluations': len(evaluations),
-            'average_score': round(sum(scores) / len(scores), 2),
-            'min_score': min(scores),
-            'max_score': max(scores)
-        }
\ No newline at end of file
+            'total_evaluations': count,
+            'average_score': round(average, 2),
+            'min_score': minimum,
+            'max_score': maximum
+        }
@@ -1,40 +1,92 @@
 """
 Service layer for question generation and retrieval.
 """
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
-from database.models import Question
-from question_types.nash_equilibrium import NashEquilibrium
+from database.models import Question, utc_now
+from question_types.base import QuestionTypeBase
 from typing import List, Optional, Dict, Any
-import uuid
+from functools import lru_cache
+import importlib
+import orjson
+import secrets
+
+
+# Rows per INSERT batch when generating questions, by database dialect
+INSERT_BATCH_SIZES = {
+    'mssql': 999,
+    'postgresql': 1000,
+    'mysql': 10000,
+    'sqlite': 10000,
+}
+DEFAULT_INSERT_BATCH_SIZE = 1000
+
+
+@lru_cache(maxsize=None)
+def _load_generator(path: str) -> QuestionTypeBase:
+    """
+    Import and instantiate a generator from a "module:Class" path.
+
+    Cached, so each generator module is imported and instantiated once, on
+    first use; generators are stateless and shared across requests.
+    """
+    module_name, class_name = path.split(':')
+    return getattr(importlib.import_module(module_name), class_name)()
 
 
 class QuestionService:
     """Service for managing question generation and retrieval."""
 
-    # Map question types to their implementation classes
+    # Map question types to their generator classes ("module:Class"), loaded on first use
     QUESTION_TYPES = {
-        'nash': NashEquilibrium(),
-        # Future: 'minimax': MinMaxAlphaBeta(),
-        # Future: 'csp': ConstraintSatisfaction(),
-        # Future: 'search': SearchStrategy(),
+        'nash': 'question_types.nash_equilibrium:NashEquilibrium',
+        # Future: 'minimax': 'question_types.minimax:MinMaxAlphaBeta',
+        # Future: 'csp': 'question_types.csp:ConstraintSatisfaction',
+        # Future: 'search': 'question_types.search:SearchStrategy',
     }
 
+    @staticmethod
+    def get_generator(question_type: str) -> QuestionTypeBase:
+        """
+        Get the shared generator instance for a question type.
+
+        Args:
+            question_type: Type of question ("nash", "minimax", "csp", "search")
+
+        Returns:
+            Generator instance for the type
+
+        Raises:
+            ValueError: If question type is not supported
+        """
+        path = QuestionService.QUESTION_TYPES.get(question_type)
+
+        if path is None:
+            raise ValueError(f"Unsupported question type: {question_type}")
+
+        return _load_generator(path)
+
     @staticmethod
     def generate_questions(
         db: Session,
         question_type: str,
         count: int = 1,
         difficulty: str = "medium",
+        batch_size: Optional[int] = None,
         **kwargs
     ) -> List[Question]:
         """
         Generate multiple questions and save to database.
 
+        Rows are inserted in batches of `batch_size` as they are generated,
+        all within a single transaction.
+
         Args:
             db: Database session
             question_type: Type of question ("nash", "minimax", "csp", "search")
             count: Number of questions to generate
             difficulty: Difficulty level ("easy", "medium", "hard")
+            batch_size: Rows per INSERT (defaults to a per-dialect size)
             **kwargs: Additional parameters for question generation
 
         Returns:
@@ -43,52 +95,82 @@ class QuestionService:
         Raises:
             ValueError: If question type is not supported
         """
-        if question_type not in QuestionService.QUESTION_TYPES:
-            raise ValueError(f"Unsupported question type: {question_type}")
-
-        generator = QuestionService.QUESTION_TYPES[question_type]
+        generator = QuestionService.get_generator(question_type)
+        batch_size = batch_size or INSERT_BATCH_SIZES.get(
+            db.get_bind().dialect.name, DEFAULT_INSERT_BATCH_SIZE
+        )
         generated_questions = []
+        pending = []
 
-        for _ in range(count):
+        # Random bits for every ID in one call: 8 hex characters per question
+        id_hex = secrets.token_hex(4 * count)
+
+        for i in range(count):
             # Generate question data
             question_dict = generator.generate_question(difficulty, **kwargs)
 
             # Create unique ID
-            question_id = f"{question_type}_{uuid.uuid4().hex[:8]}"
+            question_id = f"{question_type}_{id_hex[8 * i:8 * i + 8]}"
 
-            # Get explanation
-            explanation = generator.answer_question(
-                question_dict['question_data'],
-                detail_level='detailed'
-            )
-
-            # Create database model
+            # Create database model (timestamp set here so the response blob can embed it)
             question = Question(
                 id=question_id,
                 type=question_dict['type'],
                 difficulty=question_dict['difficulty'],
                 question_text=question_dict['question_text'],
-                explanation=explanation
+                explanation=None,  # Built on first request (see get_correct_answer)
+                created_at=utc_now()
             )
 
             # Set JSON fields
             question.set_question_data(question_dict['question_data'])
             question.set_correct_answer(question_dict['correct_answer'])
+            question.set_response_blob()
 
-            # Save to database
-            db.add(question)
             generated_questions.append(question)
+            pending.append(question)
 
-        db.commit()
+            if len(pending) >= batch_size:
+                QuestionService._insert_questions(db, pending)
+                pending = []
 
-        # Refresh to get created_at timestamps
-        for q in generated_questions:
-            db.refresh(q)
+        if pending:
+            QuestionService._insert_questions(db, pending)
+
+        db.commit()
 
         return generated_questions
 
     @staticmethod
-    def get_question(db: Session, question_id: str) -> Optional[Question]:
+    def _insert_questions(db: Session, questions: List[Question]):
+        """
+        Insert questions as plain rows with one executemany INSERT.
+
+        The objects are never added to the session, so callers read their
+        in-memory attributes without a refresh SELECT per row. With no
+        RETURNING clause this goes straight to the DBAPI's cursor.executemany,
+        the same fast path bulk_insert_mappings uses.
+        """
+        db.execute(insert(Question), [
+            {
+                'id': question.id,
+                'type': question.type,
+                'difficulty': question.difficulty,
+                'question_text': question.question_text,
+                'question_data': question.question_data,
+                'correct_answer': question.correct_answer,
+                'explanation': question.explanation,
+                'response_blob': question.response_blob,
+                'created_at': question.created_at
+            }
+            for question in questions
+        ])
+
+    @staticmethod
+    def get_question(
+        db: Session,
+        question_id: str
+    ) -> Optional[Question]:
         """
         Retrieve a question by ID.
 
@@ -99,17 +181,38 @@ class QuestionService:
         Returns:
             Question object or None if not found
         """
-        return db.query(Question).filter(Question.id == question_id).first()
+        # Primary-key lookup: served from the identity map when already loaded
+        return db.get(Question, question_id)
 
     @staticmethod
-    def get_all_questions(
+    def get_question_blob(db: Session, question_id: str) -> Optional[bytes]:
+        """
+        Retrieve the pre-serialized response JSON of a question.
+
+        Args:
+            db: Database session
+            question_id: Question ID
+
+        Returns:
+            JSON bytes or None if not found
+        """
+        return (
+            db.query(Question.response_blob)
+            .filter(Question.id == question_id)
+            .scalar()
+        )
+
+    @staticmethod
+    def get_question_blobs(
         db: Session,
         question_type: Optional[str] = None,
         difficulty: Optional[str] = None,
         limit: int = 100
-    ) -> List[Question]:
+    ) -> List[bytes]:
         """
-        Retrieve all questions with optional filters.
+        Retrieve pre-serialized response JSON of questions with optional filters.
+
+        Selects only the stored blobs, so no ORM objects are built.
 
         Args:
             db: Database session
@@ -118,9 +221,9 @@ class QuestionService:
             limit: Maximum number of questions to return
 
         Returns:
-            List of Question objects
+            List of JSON bytes, newest first
         """
-        query = db.query(Question)
+        query = db.query(Question.response_blob)
 
         if question_type:
             query = query.filter(Question.type == question_type)
@@ -128,7 +231,8 @@ class QuestionService:
         if difficulty:
             query = query.filter(Question.difficulty == difficulty)
 
-        return query.order_by(Question.created_at.desc()).limit(limit).all()
+        rows = query.order_by(Question.created_at.desc()).limit(limit).all()
+        return [blob for (blob,) in rows]
 
     @staticmethod
     def get_correct_answer(
@@ -139,6 +243,9 @@ class QuestionService:
         """
         Get the correct answer with explanation for a question.
 
+        The detailed explanation is not computed at generation time; it is
+        built on the first detailed request and stored on the question.
+
         Args:
             db: Database session
             question_id: Question ID
@@ -147,24 +254,45 @@ class QuestionService:
         Returns:
             Dictionary with answer and explanation, or None if question not found
         """
-        question = QuestionService.get_question(db, question_id)
-
-        if not question:
+        # One projected SELECT: only the columns this endpoint reads, no ORM object
+        row = (
+            db.query(Question.type, Question.question_data, Question.correct_answer, Question.explanation)
+            .filter(Question.id == question_id)
+            .first()
+        )
+
+        if row is None:
             return None
 
-        correct_answer = question.get_correct_answer()
+        correct_answer = orjson.loads(row.correct_answer)
+        generator = (
+            QuestionService.get_generator(row.type)
+            if row.type in QuestionService.QUESTION_TYPES else None
+        )
 
         # Get detailed explanation if requested
         if detail_level == "detailed":
-            explanation = question.explanation
-        else:
-            # Generate concise explanation
-            if question.type in QuestionService.QUESTION_TYPES:
-                generator = QuestionService.QUESTION_TYPES[question.type]
+            explanation = row.explanation
+
+            # Generated lazily: build it on first request and persist it
+            if explanation is None and generator is not None:
                 explanation = generator.answer_question(
-                    question.get_question_data(),
-                    detail_level='concise'
+                    orjson.loads(row.question_data),
+                    detail_level='detailed'
+                )
+                db.execute(
+                    update(Question).where(Question.id == question_id).values(explanation=explanation)
                 )
+                db.commit()
+        else:
+            # Concise explanation: read off the stored answer when the type supports it
+            if generator is not None:
+                explanation = generator.concise_explanation(correct_answer)
+                if explanation is None:
+                    explanation = generator.answer_question(
+                        orjson.loads(row.question_data),
+                        detail_level='concise'
+                    )
             else:
                 explanation = "Answer generation not available for this question type."
 
@@ -172,7 +300,7 @@ class QuestionService:
             'question_id': question_id,
             'answer': correct_answer,
             'explanation': explanation,
-            'question_type': question.type
+            'question_type': row.type
         }
 
     @staticmethod
@@ -1,10 +1,11 @@
 """
 Service layer for test management (combining multiple questions).
 """
+from sqlalchemy import func, insert, select
 from sqlalchemy.orm import Session
-from database.models import Test, TestQuestion, Question
+from database.models import Test, TestQuestion, Question, format_timestamp
 from typing import List, Optional, Dict, Any
-import uuid
+import secrets
 
 
 class TestService:
@@ -36,14 +37,13 @@ class TestService:
         if len(question_ids) != len(set(question_ids)):
             raise ValueError("Duplicate question IDs are not allowed")
 
-        # Verify all questions exist
-        for qid in question_ids:
-            question = db.query(Question).filter(Question.id == qid).first()
-            if not question:
-                return None
+        # Verify all questions exist with a single IN query
+        found = db.query(Question.id).filter(Question.id.in_(question_ids)).count()
+        if found != len(question_ids):
+            return None
 
         # Create test ID
-        test_id = f"test_{uuid.uuid4().hex[:8]}"
+        test_id = f"test_{secrets.token_hex(4)}"
 
         # Create test
         test = Test(
@@ -51,20 +51,18 @@ class TestService:
             title=title
         )
 
+        # The ID is client-side; flushing only orders the tests INSERT ahead of
+        # the association rows (same transaction, no extra round trip)
         db.add(test)
-        db.flush()  # Get the test ID before adding associations
+        db.flush()
 
-        # Create associations with ordering
-        for order_index, question_id in enumerate(question_ids):
-            test_question = TestQuestion(
-                test_id=test_id,
-                question_id=question_id,
-                order_index=order_index
-            )
-            db.add(test_question)
+        # Create associations with ordering in one executemany INSERT
+        db.execute(insert(TestQuestion), [
+            {'test_id': test_id, 'question_id': question_id, 'order_index': order_index}
+            for order_index, question_id in enumerate(question_ids)
+        ])
 
         db.commit()
-        db.refresh(test)
 
         return test
 
@@ -80,55 +78,76 @@ class TestService:
         Returns:
             Test object or None if not found
         """
-        return db.query(Test).filter(Test.id == test_id).first()
+        return db.get(Test, test_id)
 
     @staticmethod
-    def get_test_questions(db: Session, test_id: str) -> Optional[List[Question]]:
+    def get_test_row(db: Session, test_id: str) -> Optional[Dict[str, Any]]:
         """
-        Get all questions in a test, ordered by their position.
+        Retrieve a test's own fields as a plain dict.
 
         Args:
             db: Database session
             test_id: Test ID
 
         Returns:
-            List of Question objects in order, or None if test not found
+            Dict with id, title and created_at (ISO string), or None if not found
         """
-        test = TestService.get_test(db, test_id)
+        row = db.execute(
+            select(Test.id, Test.title, Test.created_at).where(Test.id == test_id)
+        ).first()
 
-        if not test:
+        if row is None:
             return None
 
-        # Get questions through the association table, ordered
-        test_questions = (
-            db.query(TestQuestion)
-            .filter(TestQuestion.test_id == test_id)
-            .order_by(TestQuestion.order_index)
-            .all()
-        )
+        return {'id': row.id, 'title': row.title, 'created_at': format_timestamp(row.created_at)}
 
-        # Get the actual Question objects
-        questions = []
-        for tq in test_questions:
-            question = db.query(Question).filter(Question.id == tq.question_id).first()
-            if question:
-                questions.append(question)
+    @staticmethod
+    def get_test_question_blobs(db: Session, test_id: str) -> List[bytes]:
+        """
+        Retrieve the pre-serialized response JSON of a test's questions.
 
-        return questions
+        A single join over test_questions, ordered by position, selecting
+        only the stored blobs.
+
+        Args:
+            db: Database session
+            test_id: Test ID
+
+        Returns:
+            List of JSON bytes in test order
+        """
+        return db.execute(
+            select(Question.response_blob)
+            .join(TestQuestion, TestQuestion.question_id == Question.id)
+            .where(TestQuestion.test_id == test_id)
+            .order_by(TestQuestion.order_index)
+        ).scalars().all()
 
     @staticmethod
-    def get_all_tests(db: Session, limit: int = 100) -> List[Test]:
+    def get_all_test_rows(db: Session, limit: int = 100) -> List[Dict[str, Any]]:
         """
-        Retrieve all tests.
+        Retrieve all tests as plain dicts for list responses.
+
+        Only the listed columns are selected (no ORM objects); created_at
+        is formatted with format_timestamp like every other endpoint.
 
         Args:
             db: Database session
             limit: Maximum number of tests to return
 
         Returns:
-            List of Test objects
+            List of dicts with id, title and created_at, newest first
         """
-        return db.query(Test).order_by(Test.created_at.desc()).limit(limit).all()
+        rows = (
+            db.query(Test.id, Test.title, Test.created_at)
+            .order_by(Test.created_at.desc())
+            .limit(limit)
+            .all()
+        )
+        return [
+            {'id': row.id, 'title': row.title, 'created_at': format_timestamp(row.created_at)}
+            for row in rows
+        ]
 
     @staticmethod
     def delete_test(db: Session, test_id: str) -> bool:
@@ -168,21 +187,30 @@ class TestService:
         if not test:
             return None
 
-        questions = TestService.get_test_questions(db, test_id)
+        # Count questions per (type, difficulty) in SQL; at most a few rows come back
+        counts = (
+            db.query(Question.type, Question.difficulty, func.count())
+            .join(TestQuestion, TestQuestion.question_id == Question.id)
+            .filter(TestQuestion.test_id == test_id)
+            .group_by(Question.type, Question.difficulty)
+            .all()
+        )
 
-        # Count questions by type
+        # Roll the pairs up into per-type and per-difficulty counts
         type_counts = {}
         difficulty_counts = {}
+        total_questions = 0
 
-        for q in questions:
-            type_counts[q.type] = type_counts.get(q.type, 0) + 1
-            difficulty_counts[q.difficulty] = difficulty_counts.get(q.difficulty, 0) + 1
+        for question_type, difficulty, count in counts:
+            type_counts[question_type] = type_counts.get(question_type, 0) + count
+            difficulty_counts[difficulty] = difficulty_counts.get(difficulty, 0) + count
+            total_questions += count
 
         return {
             'test_id': test_id,
             'title': test.title,
-            'created_at': test.created_at.isoformat() if test.created_at else None,
-            'total_questions': len(questions),
+            'created_at': format_timestamp(test.created_at) if test.created_at else None,
+            'total_questions': total_questions,
             'questions_by_type': type_counts,
             'questions_by_difficulty': difficulty_counts
         }
\ No newline at end of file